@@ -1,6 +1,8 @@
 """
 OpenCV camera implementation
 """
+import threading
+import time
 import cv2
 import numpy as np
 from typing import Optional
@@ -8,21 +10,46 @@ from domain.interfaces import ICamera
 
 
 class OpenCVCamera(ICamera):
-    """OpenCV camera implementation"""
+    """OpenCV camera implementation with capture on a background thread"""
     
-    def __init__(self):
+    def __init__(self, read_timeout: Optional[float] = None):
+        """
+        Initialize camera
+        
+        Args:
+            read_timeout: Seconds read() waits for a new frame before failing;
+                None waits as long as the capture thread is running (some
+                webcams take seconds to deliver the first frame)
+        """
         self.cap = None
         self._opened = False
+        self.read_timeout = read_timeout
+        
+        # Single-slot latest frame shared with the capture thread
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._frame_ready = threading.Condition()
+        self._latest: Optional[np.ndarray] = None
+        self._frame_id = 0  # Increments for every captured frame
+        self._read_id = 0  # Frame id last returned by read()
+        self._capturing = False
+        
+        # Effective capture rate, measured over every 30 frames
+        self._capture_fps = 0.0
     
     def open(self, camera_index: int = 0) -> bool:
-        """Open camera"""
+        """Open camera and start the capture thread"""
         try:
             self.cap = cv2.VideoCapture(camera_index)
             if self.cap.isOpened():
                 # Set camera properties for better performance
+                self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
                 self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
                 self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                # Keep only the newest frame in the driver queue
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
                 self._opened = True
+                self._start_capture()
                 return True
             else:
                 self._opened = False
@@ -32,24 +59,78 @@ class OpenCVCamera(ICamera):
             self._opened = False
             return False
     
+    def _start_capture(self) -> None:
+        """Start the background capture thread"""
+        self._stop.clear()
+        self._latest = None
+        self._frame_id = 0
+        self._read_id = 0
+        self._capturing = True
+        self._capture_fps = 0.0
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+    
+    def _capture_loop(self) -> None:
+        """Capture frames continuously, keeping only the newest one"""
+        fps_start_time = time.monotonic()
+        fps_frame_count = 0
+        
+        while not self._stop.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+            
+            fps_frame_count += 1
+            if fps_frame_count >= 30:
+                now = time.monotonic()
+                self._capture_fps = fps_frame_count / (now - fps_start_time)
+                fps_start_time = now
+                fps_frame_count = 0
+            
+            # cap.read() allocates a new array per frame, so readers can keep it
+            with self._frame_ready:
+                self._latest = frame
+                self._frame_id += 1
+                self._frame_ready.notify_all()
+        
+        with self._frame_ready:
+            self._capturing = False
+            self._frame_ready.notify_all()
+    
     def read(self) -> Optional[tuple]:
-        """Read frame from camera"""
+        """Read the newest frame not yet returned, waiting for it if needed"""
         if not self._opened or self.cap is None:
             return None
         
-        ret, frame = self.cap.read()
-        if ret:
-            return (True, frame)
-        return None
+        with self._frame_ready:
+            self._frame_ready.wait_for(
+                lambda: self._frame_id != self._read_id or not self._capturing,
+                timeout=self.read_timeout
+            )
+            if self._frame_id == self._read_id:
+                return None
+            self._read_id = self._frame_id
+            return (True, self._latest)
     
     def release(self) -> None:
-        """Release camera resources"""
+        """Stop the capture thread and release camera resources"""
+        self._stop.set()
+        if self._thread is not None:
+            # cap.read() may block on a stalled device; release() unblocks it
+            self._thread.join(timeout=1.0)
+            self._thread = None
         if self.cap is not None:
             self.cap.release()
             self.cap = None
+        self._latest = None
+        self._capture_fps = 0.0
         self._opened = False
     
     def is_opened(self) -> bool:
         """Check if camera is opened"""
         return self._opened and self.cap is not None and self.cap.isOpened()
-
+    
+    @property
+    def capture_fps(self) -> float:
+        """Rate at which the capture thread receives new frames"""
+        return self._capture_fps
@@ -2,11 +2,18 @@
 MediaPipe Hands implementation of IHandDetector
 """
 import time
+import cv2
 import numpy as np
-from typing import Optional
+from typing import List, Optional, Tuple
 import mediapipe as mp
 from domain.interfaces import IHandDetector
-from domain.models import DetectionResult, Hand, Point
+from domain.models import DetectionResult, Hand
+
+# Minimum hand confidence for reusing the previous result on skipped frames
+_SKIP_CONFIDENCE = 0.9
+
+# Raw detection: landmarks (N, 21, 3) float32, confidences (N,) float32, handedness labels
+RawDetection = Tuple[np.ndarray, np.ndarray, List[str]]
 
 
 class MediaPipeHandDetector(IHandDetector):
@@ -16,7 +23,11 @@ class MediaPipeHandDetector(IHandDetector):
                  static_image_mode: bool = False,
                  max_num_hands: int = 2,
                  min_detection_confidence: float = 0.5,
-                 min_tracking_confidence: float = 0.5):
+                 min_tracking_confidence: float = 0.5,
+                 skip_interval: int = 2,
+                 input_width: Optional[int] = 320,
+                 use_gpu: bool = False,
+                 model_asset_path: Optional[str] = None):
         """
         Initialize MediaPipe Hand Detector
         
@@ -25,18 +36,57 @@ class MediaPipeHandDetector(IHandDetector):
             max_num_hands: Maximum number of hands to detect
             min_detection_confidence: Minimum confidence for hand detection
             min_tracking_confidence: Minimum confidence for hand tracking
+            skip_interval: Run the model once every N frames while hands are
+                tracked with high confidence (1 disables skipping, ignored in
+                static image mode)
+            input_width: Wider frames are downscaled to this width (keeping
+                aspect ratio) before inference; None disables downscaling
+            use_gpu: Run inference with the MediaPipe Tasks hand landmarker on
+                the GPU delegate, falling back to the CPU solution if the GPU
+                graph cannot be created
+            model_asset_path: Path to the hand_landmarker.task model bundle
+                (required for GPU inference)
         """
         self.static_image_mode = static_image_mode
         self.max_num_hands = max_num_hands
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
+        self.skip_interval = 1 if static_image_mode else max(1, skip_interval)
+        self.input_width = input_width
+        self.use_gpu = use_gpu
+        self.model_asset_path = model_asset_path
         
         self.mp_hands = mp.solutions.hands
         self.hands = None
+        self._landmarker = None  # GPU Tasks landmarker, when active
+        self._last_timestamp_ms = 0
         self._initialized = False
+        
+        # Reusable scratch buffers for downscaling and BGR -> RGB conversion
+        # (preallocated for the default 640x480 camera)
+        self._buffers = {
+            'small': np.empty((240, 320, 3), dtype=np.uint8),
+            'rgb': np.empty((240, 320, 3), dtype=np.uint8),
+        }
+        
+        # Cached result reused on skipped frames
+        self._frame_counter = 0
+        self._last_raw: Optional[RawDetection] = None
     
     def initialize(self) -> bool:
-        """Initialize MediaPipe Hands"""
+        """Initialize MediaPipe Hands (GPU landmarker if requested and available)"""
+        if self._initialized:
+            return True
+        
+        if self.use_gpu:
+            try:
+                self._landmarker = self._create_gpu_landmarker()
+                self._initialized = True
+                return True
+            except Exception as e:
+                print(f"GPU hand landmarker unavailable, using CPU: {e}")
+                self._landmarker = None
+        
         try:
             self.hands = self.mp_hands.Hands(
                 static_image_mode=self.static_image_mode,
@@ -51,6 +101,69 @@ class MediaPipeHandDetector(IHandDetector):
             self._initialized = False
             return False
     
+    @property
+    def is_initialized(self) -> bool:
+        """Check if MediaPipe Hands is initialized"""
+        return self._initialized
+    
+    def _create_gpu_landmarker(self):
+        """Create a MediaPipe Tasks hand landmarker on the GPU delegate"""
+        if not self.model_asset_path:
+            raise ValueError("model_asset_path is required for GPU inference")
+        
+        vision = mp.tasks.vision
+        options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(
+                model_asset_path=self.model_asset_path,
+                delegate=mp.tasks.BaseOptions.Delegate.GPU
+            ),
+            running_mode=(vision.RunningMode.IMAGE if self.static_image_mode
+                          else vision.RunningMode.VIDEO),
+            num_hands=self.max_num_hands,
+            min_hand_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence
+        )
+        return vision.HandLandmarker.create_from_options(options)
+    
+    def _run_model(self, rgb_image: np.ndarray) -> List[Tuple[np.ndarray, str, float]]:
+        """
+        Run the active MediaPipe backend on an RGB image
+        
+        Args:
+            rgb_image: Input image in RGB format
+            
+        Returns:
+            List of (landmarks (21, 3) float32, handedness, confidence) per hand
+        """
+        if self._landmarker is not None:
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_image)
+            if self.static_image_mode:
+                result = self._landmarker.detect(mp_image)
+            else:
+                # Video mode requires strictly increasing timestamps
+                self._last_timestamp_ms = max(self._last_timestamp_ms + 1,
+                                              int(time.monotonic() * 1000))
+                result = self._landmarker.detect_for_video(mp_image, self._last_timestamp_ms)
+            
+            return [
+                (np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks], dtype=np.float32),
+                 handedness[0].category_name,
+                 handedness[0].score)
+                for hand_landmarks, handedness in zip(result.hand_landmarks, result.handedness)
+            ]
+        
+        results = self.hands.process(rgb_image)
+        if not results.multi_hand_landmarks:
+            return []
+        
+        return [
+            (np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32),
+             handedness.classification[0].label,
+             handedness.classification[0].score)
+            for hand_landmarks, handedness in zip(results.multi_hand_landmarks,
+                                                  results.multi_handedness)
+        ]
+    
     def detect(self, image: np.ndarray) -> Optional[DetectionResult]:
         """
         Detect hands in image
@@ -61,41 +174,126 @@ class MediaPipeHandDetector(IHandDetector):
         Returns:
             DetectionResult or None
         """
-        if not self._initialized or self.hands is None:
+        return self._to_result(self.detect_raw(image))
+    
+    def detect_raw(self, image: np.ndarray) -> Optional[RawDetection]:
+        """
+        Detect hands in image without building Hand/Point objects
+        
+        Args:
+            image: Input image in BGR format
+            
+        Returns:
+            Tuple of (landmarks (N, 21, 3) float32, confidences (N,) float32,
+            handedness labels), or None if no hands detected
+        """
+        if not self._initialized:
             return None
         
-        # Convert BGR to RGB
-        rgb_image = np.flip(image, axis=-1)
+        # Reuse the previous result between model runs while tracking is confident
+        self._frame_counter += 1
+        if (self._last_raw is not None and
+                self._frame_counter % self.skip_interval != 0 and
+                self._last_raw[1].max() > _SKIP_CONFIDENCE):
+            return self._last_raw
         
-        # Process the image
-        results = self.hands.process(rgb_image)
+        # Downscale once before color conversion; landmarks are normalized,
+        # so results still map onto the full-resolution frame
+        input_size = self._input_size(image)
+        if input_size is not None:
+            small = self._buffer('small', (input_size[1], input_size[0], 3))
+            cv2.resize(image, input_size, dst=small, interpolation=cv2.INTER_AREA)
+            image = small
         
-        if not results.multi_hand_landmarks:
-            return None
+        # Convert BGR to RGB into the reusable buffer
+        rgb = self._buffer('rgb', image.shape)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=rgb)
         
-        hands = []
-        for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-            # Get handedness
-            handedness = results.multi_handedness[idx].classification[0].label
-            
-            # Extract landmarks
-            landmarks = []
-            for landmark in hand_landmarks.landmark:
-                landmarks.append(Point(
-                    x=landmark.x,
-                    y=landmark.y,
-                    z=landmark.z
-                ))
-            
-            # Get confidence
-            confidence = results.multi_handedness[idx].classification[0].score
+        return self._detect_rgb(rgb)
+    
+    def detect_batch(self, images: np.ndarray) -> List[Optional[DetectionResult]]:
+        """
+        Detect hands in a stack of frames, sharing the preprocessing work
+        
+        Frames are downscaled into one stacked buffer and converted to RGB
+        with a single cv2.cvtColor call. Every frame is run through the model
+        in order (no frame skipping), so tracking state stays consistent.
+        
+        Args:
+            images: Input frames as an (N, H, W, 3) BGR array
             
-            hands.append(Hand(
-                landmarks=landmarks,
-                handedness=handedness,
-                confidence=confidence
-            ))
+        Returns:
+            DetectionResult or None for each frame
+        """
+        if not self._initialized or len(images) == 0:
+            return [None] * len(images)
+        
+        count = len(images)
+        input_size = self._input_size(images[0])
+        if input_size is not None:
+            small = self._buffer('batch_small', (count, input_size[1], input_size[0], 3))
+            for idx in range(count):
+                cv2.resize(images[idx], input_size, dst=small[idx],
+                           interpolation=cv2.INTER_AREA)
+            images = small
+        images = np.ascontiguousarray(images)
+        
+        # One color conversion over the frames viewed as a single tall image
+        rgb = self._buffer('batch_rgb', images.shape)
+        height, width = images.shape[1:3]
+        cv2.cvtColor(images.reshape(-1, width, 3), cv2.COLOR_BGR2RGB,
+                     dst=rgb.reshape(-1, width, 3))
+        
+        self._frame_counter += count
+        return [self._to_result(self._detect_rgb(rgb[idx])) for idx in range(count)]
+    
+    def _buffer(self, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """Writable uint8 scratch buffer, reallocated only when the shape changes"""
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._buffers[name] = buffer
+        buffer.flags.writeable = True
+        return buffer
+    
+    def _input_size(self, image: np.ndarray) -> Optional[Tuple[int, int]]:
+        """(width, height) to downscale the image to, or None to keep its size"""
+        frame_h, frame_w = image.shape[:2]
+        if self.input_width is None or frame_w <= self.input_width:
+            return None
+        return (self.input_width, round(frame_h * self.input_width / frame_w))
+    
+    def _detect_rgb(self, rgb_image: np.ndarray) -> Optional[RawDetection]:
+        """Run the model on a preprocessed RGB image and cache the raw result"""
+        # Read-only input lets MediaPipe skip its defensive copy
+        rgb_image.flags.writeable = False
+        detected = self._run_model(rgb_image)
+        
+        if not detected:
+            self._last_raw = None
+            return None
+        
+        landmarks, handedness, confidences = zip(*detected)
+        self._last_raw = (
+            np.stack(landmarks),
+            np.array(confidences, dtype=np.float32),
+            list(handedness)
+        )
+        return self._last_raw
+    
+    @staticmethod
+    def _to_result(raw: Optional[RawDetection]) -> Optional[DetectionResult]:
+        """Wrap a raw detection as a DetectionResult (Points are built lazily)"""
+        if raw is None:
+            return None
         
+        landmarks, confidences, handedness = raw
+        hands = [
+            Hand(landmarks_np=landmarks[idx],
+                 handedness=handedness[idx],
+                 confidence=float(confidences[idx]))
+            for idx in range(len(handedness))
+        ]
         return DetectionResult(
             hands=hands,
             timestamp=time.time()
@@ -106,4 +304,9 @@ class MediaPipeHandDetector(IHandDetector):
         if self.hands:
             self.hands.close()
             self.hands = None
+        if self._landmarker is not None:
+            self._landmarker.close()
+            self._landmarker = None
+        self._last_raw = None
+        self._frame_counter = 0
         self._initialized = False
@@ -0,0 +1,109 @@
+"""
+Numeric kernels for the per-frame gesture, collision and landmark drawing work
+
+Compiled with Numba when it is installed, otherwise NumPy implementations are used.
+"""
+import numpy as np
+from domain.models import HandLandmark
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Landmark indices used by the closed-hand check
+_WRIST = HandLandmark.WRIST.value
+_FINGERTIPS = (
+    HandLandmark.THUMB_TIP.value,
+    HandLandmark.INDEX_FINGER_TIP.value,
+    HandLandmark.MIDDLE_FINGER_TIP.value,
+    HandLandmark.RING_FINGER_TIP.value,
+    HandLandmark.PINKY_TIP.value,
+)
+_PIPS = (
+    HandLandmark.THUMB_IP.value,
+    HandLandmark.INDEX_FINGER_PIP.value,
+    HandLandmark.MIDDLE_FINGER_PIP.value,
+    HandLandmark.RING_FINGER_PIP.value,
+    HandLandmark.PINKY_PIP.value,
+)
+_FINGERTIP_ROWS = np.array(_FINGERTIPS)
+_PIP_ROWS = np.array(_PIPS)
+
+# Maximum thumb tip to wrist distance (normalized) for a bent thumb, squared
+_THUMB_THRESHOLD_SQ = 0.15 * 0.15
+
+
+def _hand_closed_np(lm: np.ndarray) -> bool:
+    """NumPy closed-hand check on a (21, 2+) landmark array"""
+    tips = lm[_FINGERTIP_ROWS]
+    pips = lm[_PIP_ROWS]
+    
+    # Other fingers are bent when the tip is below the PIP joint
+    bent_fingers = np.count_nonzero(tips[1:, 1] > pips[1:, 1])
+    
+    # Thumb is bent when its tip is close to the wrist
+    dx = tips[0, 0] - lm[_WRIST, 0]
+    dy = tips[0, 1] - lm[_WRIST, 1]
+    thumb_closed = dx * dx + dy * dy < _THUMB_THRESHOLD_SQ
+    
+    # Hand is closed if at least 4 out of 5 fingers are closed
+    return int(bent_fingers) + int(thumb_closed) >= 4
+
+
+def _collide_np(bubbles_xy: np.ndarray, radii_sq: np.ndarray,
+                px: float, py: float) -> np.ndarray:
+    """NumPy collision check returning indices of bubbles containing the pointer"""
+    dx = bubbles_xy[:, 0] - px
+    dy = bubbles_xy[:, 1] - py
+    return np.flatnonzero(dx * dx + dy * dy <= radii_sq).astype(np.int32)
+
+
+def _scale_landmarks_np(lm: np.ndarray, width: float, height: float) -> np.ndarray:
+    """NumPy scaling of normalized landmarks to (N, 2) int32 pixel coordinates"""
+    return (lm[:, :2] * (width, height)).astype(np.int32)
+
+
+if HAS_NUMBA:
+    @njit('b1(f4[:, ::1])', cache=True, fastmath=True)
+    def hand_closed(lm):
+        """Closed-hand check on a float32 (21, 2+) landmark array"""
+        closed_fingers = 0
+        for i in range(1, 5):
+            if lm[_FINGERTIPS[i], 1] > lm[_PIPS[i], 1]:
+                closed_fingers += 1
+        
+        dx = lm[_FINGERTIPS[0], 0] - lm[_WRIST, 0]
+        dy = lm[_FINGERTIPS[0], 1] - lm[_WRIST, 1]
+        if dx * dx + dy * dy < _THUMB_THRESHOLD_SQ:
+            closed_fingers += 1
+        
+        return closed_fingers >= 4
+    
+    @njit('i4[:](f4[:, ::1], f4[::1], f4, f4)', cache=True, fastmath=True)
+    def collide(bubbles_xy, radii_sq, px, py):
+        """Indices of bubbles (pixel centers, squared hit radii) containing the pointer"""
+        hits = np.empty(bubbles_xy.shape[0], dtype=np.int32)
+        count = 0
+        for i in range(bubbles_xy.shape[0]):
+            dx = bubbles_xy[i, 0] - px
+            dy = bubbles_xy[i, 1] - py
+            if dx * dx + dy * dy <= radii_sq[i]:
+                hits[count] = i
+                count += 1
+        return hits[:count]
+    
+    @njit('i4[:, ::1](f4[:, ::1], f8, f8)', cache=True)
+    def scale_landmarks(lm, width, height):
+        """Normalized (N, 2+) landmarks to (N, 2) int32 pixel coordinates (truncated)"""
+        out = np.empty((lm.shape[0], 2), dtype=np.int32)
+        for i in range(lm.shape[0]):
+            out[i, 0] = np.int32(lm[i, 0] * width)
+            out[i, 1] = np.int32(lm[i, 1] * height)
+        return out
+else:
+    hand_closed = _hand_closed_np
+    collide = _collide_np
+    scale_landmarks = _scale_landmarks_np
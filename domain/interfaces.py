@@ -2,7 +2,7 @@
 Domain interfaces - Abstract contracts for hand detection
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 import numpy as np
 
 
@@ -22,16 +22,36 @@ class IHandDetector(ABC):
         """
         pass
     
+    def detect_batch(self, images: np.ndarray) -> List[Optional['DetectionResult']]:
+        """
+        Detect hands in a stack of frames, in order
+        
+        Implementations may override this to share work across frames.
+        
+        Args:
+            images: Input frames as an (N, H, W, 3) array (BGR format)
+            
+        Returns:
+            DetectionResult or None for each frame
+        """
+        return [self.detect(image) for image in images]
+    
     @abstractmethod
     def initialize(self) -> bool:
         """
-        Initialize the hand detector
+        Initialize the hand detector (no-op if already initialized)
         
         Returns:
             True if initialization successful, False otherwise
         """
         pass
     
+    @property
+    @abstractmethod
+    def is_initialized(self) -> bool:
+        """Check if the detector is initialized"""
+        pass
+    
     @abstractmethod
     def release(self) -> None:
         """Release resources"""
@@ -73,4 +93,9 @@ class ICamera(ABC):
     def is_opened(self) -> bool:
         """Check if camera is opened"""
         pass
+    
+    @property
+    def capture_fps(self) -> float:
+        """Rate at which new frames arrive from the device (0.0 if not measured)"""
+        return 0.0
 
@@ -1,9 +1,12 @@
 """
 Domain models for hand detection
 """
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import cached_property
+from typing import Iterator, List, Optional
 from enum import Enum
+import numpy as np
 
 
 class HandLandmark(Enum):
@@ -39,12 +42,59 @@ class Point:
     z: Optional[float] = None
 
 
+class LandmarkView(Sequence):
+    """Read-only sequence of Points over a (21, 3) landmark array, built on access"""
+    __slots__ = ('_array', '_points')
+    
+    def __init__(self, array: np.ndarray):
+        self._array = array
+        self._points: List[Optional[Point]] = [None] * len(array)
+    
+    def __len__(self) -> int:
+        return len(self._array)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        point = self._points[index]
+        if point is None:
+            x, y, z = self._array[index].tolist()
+            point = self._points[index] = Point(x, y, z)
+        return point
+    
+    def __iter__(self) -> Iterator[Point]:
+        for index in range(len(self)):
+            yield self[index]
+
+
 @dataclass
 class Hand:
     """Represents a detected hand with landmarks"""
-    landmarks: List[Point]
+    landmarks_np: np.ndarray  # (21, 3) float32 array of x, y, z
     handedness: str  # "Left" or "Right"
     confidence: float
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare by value (the generated __eq__ cannot compare arrays)"""
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return (self.handedness == other.handedness and self.confidence == other.confidence
+                and np.array_equal(self.landmarks_np, other.landmarks_np))
+    
+    @cached_property
+    def landmarks(self) -> LandmarkView:
+        """Landmarks as Points, constructed only for the indices accessed"""
+        return LandmarkView(self.landmarks_np)
+    
+    @cached_property
+    def xy(self) -> np.ndarray:
+        """(21, 2) contiguous float32 array of normalized x, y"""
+        return np.ascontiguousarray(self.landmarks_np[:, :2], dtype=np.float32)
+    
+    @property
+    def z(self) -> np.ndarray:
+        """(21,) float32 view of the landmark depths"""
+        return self.landmarks_np[:, 2]
 
 
 @dataclass
@@ -29,7 +29,8 @@ def main():
             static_image_mode=False,
             max_num_hands=2,
             min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
+            min_tracking_confidence=0.5,
+            input_width=320  # Detect on a 320px-wide copy; None uses full resolution
         )
         
         camera = OpenCVCamera()
@@ -17,23 +17,32 @@ class AppFlow:
             static_image_mode=False,
             max_num_hands=2,
             min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
+            min_tracking_confidence=0.5,
+            input_width=320  # Detect on a 320px-wide copy; None uses full resolution
         )
         self.camera: Optional[OpenCVCamera] = None
         self.player_name: Optional[str] = None
     
-    def show_menu(self) -> str:
-        """Show menu and get user selection"""
-        # Initialize camera once and reuse
+    def _ensure_ready(self) -> bool:
+        """
+        Open the camera and initialize the detector on first use
+        
+        Both are kept for the whole flow so later stages reuse them.
+        
+        Returns:
+            True if camera and detector are ready
+        """
         if self.camera is None:
             self.camera = OpenCVCamera()
             if not self.camera.open():
-                return "exit"
+                return False
         
-        # Initialize detector once
-        if not hasattr(self.detector, '_initialized') or not self.detector._initialized:
-            if not self.detector.initialize():
-                return "exit"
+        return self.detector.initialize()
+    
+    def show_menu(self) -> str:
+        """Show menu and get user selection"""
+        if not self._ensure_ready():
+            return "exit"
         
         menu = MenuSystem(self.detector, self.camera)
         
@@ -50,7 +59,7 @@ class AppFlow:
             return "exit"
         
         _, frame = result
-        h, w = frame.shape[:2]
+        w, h = MenuSystem.display_size(frame.shape[1], frame.shape[0])
         
         # Position menu items
         center_x = w // 2
@@ -69,10 +78,8 @@ class AppFlow:
         print("\nStarting game...\n")
         
         # Reuse existing camera and detector (already initialized)
-        if self.camera is None:
-            self.camera = OpenCVCamera()
-            if not self.camera.open():
-                return
+        if not self._ensure_ready():
+            return
         
         game_viewer = BubbleGameViewer(self.detector, self.camera)
         game_viewer.run()
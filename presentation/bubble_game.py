@@ -6,6 +6,7 @@ import time
 import numpy as np
 from typing import List, Optional
 from domain.models import Bubble, Hand, Point, HandLandmark
+from domain._kernels import collide
 
 
 class BubbleGame:
@@ -36,21 +37,78 @@ class BubbleGame:
         self.min_radius = min_radius
         self.max_radius = max_radius
         
-        self.bubbles: List[Bubble] = []
+        # Bubble state as parallel arrays; active bubbles occupy slots [0, _count)
+        self._pos = np.zeros((max_bubbles, 2), dtype=np.float32)  # Normalized x, y
+        self._vel = np.zeros((max_bubbles, 2), dtype=np.float32)  # Normalized per second
+        self._radius = np.zeros(max_bubbles, dtype=np.float32)  # Pixels
+        self._hit_radius_sq = np.zeros(max_bubbles, dtype=np.float32)  # Squared pixels
+        self._color_idx = np.zeros(max_bubbles, dtype=np.uint8)  # Row in bubble_colors
+        self._points = np.zeros(max_bubbles, dtype=np.int32)
+        self._ids = np.zeros(max_bubbles, dtype=np.int64)
+        self._count = 0
+        self._state_arrays = (self._pos, self._vel, self._radius, self._hit_radius_sq,
+                              self._color_idx, self._points, self._ids)
+        self._scale = np.array([screen_width, screen_height], dtype=np.float32)
+        self._inv_scale = np.array([1.0 / screen_width, 1.0 / screen_height], dtype=np.float32)
+        
         self.next_bubble_id = 0
         self.last_spawn_time = time.time()
         self.score = 0
         self.bubbles_popped = 0
         
-        # Bubble colors (BGR format for OpenCV)
-        self.bubble_colors = [
+        # Bubble color lookup table (BGR format for OpenCV)
+        self.bubble_colors = np.array([
             (255, 100, 100),  # Light blue
             (100, 255, 100),  # Light green
             (100, 100, 255),  # Light red
             (255, 255, 100),  # Cyan
             (255, 100, 255),  # Magenta
             (100, 255, 255),  # Yellow
-        ]
+        ], dtype=np.uint8)
+    
+    @property
+    def bubbles(self) -> List[Bubble]:
+        """Active bubbles as Bubble objects (built on access, e.g. for rendering)"""
+        return [self._bubble_at(idx) for idx in range(self._count)]
+    
+    @property
+    def bubble_count(self) -> int:
+        """Number of active bubbles"""
+        return self._count
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """(N, 2) normalized centers of the active bubbles (read-only view)"""
+        return self._read_only(self._pos[:self._count])
+    
+    @property
+    def radii(self) -> np.ndarray:
+        """(N,) radii in pixels of the active bubbles (read-only view)"""
+        return self._read_only(self._radius[:self._count])
+    
+    @property
+    def color_indices(self) -> np.ndarray:
+        """(N,) rows of bubble_colors for the active bubbles (read-only view)"""
+        return self._read_only(self._color_idx[:self._count])
+    
+    @staticmethod
+    def _read_only(view: np.ndarray) -> np.ndarray:
+        """Mark a view of the internal state read-only (the arrays themselves stay writable)"""
+        view.flags.writeable = False
+        return view
+    
+    def _bubble_at(self, idx: int) -> Bubble:
+        """Build a Bubble view of the given slot"""
+        return Bubble(
+            x=float(self._pos[idx, 0]),
+            y=float(self._pos[idx, 1]),
+            radius=int(self._radius[idx]),
+            velocity_x=float(self._vel[idx, 0]),
+            velocity_y=float(self._vel[idx, 1]),
+            color=tuple(self.bubble_colors[self._color_idx[idx]].tolist()),
+            id=int(self._ids[idx]),
+            points=int(self._points[idx])
+        )
     
     def update(self, delta_time: float) -> None:
         """
@@ -62,44 +120,55 @@ class BubbleGame:
         current_time = time.time()
         
         # Spawn new bubbles
-        if (len(self.bubbles) < self.max_bubbles and 
+        if (self._count < self.max_bubbles and 
             current_time - self.last_spawn_time >= 1.0 / self.spawn_rate):
             self._spawn_bubble()
             self.last_spawn_time = current_time
         
-        # Update bubble positions
-        bubbles_to_remove = []
-        for bubble in self.bubbles:
-            # Update position with frame-rate independent movement
-            # Clamp delta_time to prevent large jumps
-            clamped_delta = min(delta_time, 0.1)  # Max 0.1s per frame
-            bubble.x += bubble.velocity_x * clamped_delta
-            bubble.y += bubble.velocity_y * clamped_delta
-            
-            # Bounce off walls
-            pixel_x = bubble.x * self.screen_width
-            pixel_y = bubble.y * self.screen_height
-            
-            if pixel_x - bubble.radius <= 0 or pixel_x + bubble.radius >= self.screen_width:
-                bubble.velocity_x *= -1
-                bubble.x = max(bubble.radius / self.screen_width, 
-                              min(bubble.x, 1.0 - bubble.radius / self.screen_width))
-            
-            if pixel_y - bubble.radius <= 0 or pixel_y + bubble.radius >= self.screen_height:
-                bubble.velocity_y *= -1
-                bubble.y = max(bubble.radius / self.screen_height,
-                             min(bubble.y, 1.0 - bubble.radius / self.screen_height))
-            
-            # Remove bubbles that are too old or off screen (safety check)
-            if bubble.x < -0.1 or bubble.x > 1.1 or bubble.y < -0.1 or bubble.y > 1.1:
-                bubbles_to_remove.append(bubble)
+        # Views of the active slots
+        n = self._count
+        pos = self._pos[:n]
+        vel = self._vel[:n]
+        
+        # Update positions with frame-rate independent movement
+        # Clamp delta_time to prevent large jumps
+        clamped_delta = min(delta_time, 0.1)  # Max 0.1s per frame
+        pos += vel * clamped_delta
+        
+        # Bounce off walls: flip velocity on each touching axis, then clamp inside
+        radius = self._radius[:n, None]
+        pixel_pos = pos * self._scale
+        touching = (pixel_pos - radius <= 0) | (pixel_pos + radius >= self._scale)
+        vel[touching] *= -1
+        normalized_radius = radius * self._inv_scale
+        np.clip(pos, normalized_radius, 1.0 - normalized_radius, out=pos)
+        
+        # Remove bubbles that are off screen (safety check)
+        off_screen = ((pos < -0.1) | (pos > 1.1)).any(axis=1)
+        if off_screen.any():
+            self._remove(np.flatnonzero(off_screen))
+    
+    def _remove(self, indices: np.ndarray) -> None:
+        """
+        Remove bubbles by compacting the remaining active slots in order
         
-        # Remove bubbles
-        for bubble in bubbles_to_remove:
-            self.bubbles.remove(bubble)
+        Args:
+            indices: Slot indices to remove
+        """
+        n = self._count
+        keep = np.ones(n, dtype=bool)
+        keep[indices] = False
+        remaining = int(np.count_nonzero(keep))
+        
+        for array in self._state_arrays:
+            array[:remaining] = array[:n][keep]
+        self._count = remaining
     
     def _spawn_bubble(self) -> None:
-        """Spawn a new bubble"""
+        """Spawn a new bubble into the first free slot"""
+        if self._count >= len(self._ids):
+            return
+        
         radius = random.randint(self.min_radius, self.max_radius)
         
         # Spawn from random edge with slower, more controlled velocities
@@ -125,21 +194,19 @@ class BubbleGame:
             velocity_x = random.uniform(0.08, 0.25)
             velocity_y = random.uniform(-0.15, 0.15)
         
-        bubble = Bubble(
-            x=x,
-            y=y,
-            radius=radius,
-            velocity_x=velocity_x,
-            velocity_y=velocity_y,
-            color=random.choice(self.bubble_colors),
-            id=self.next_bubble_id,
-            points=radius // 5  # More points for bigger bubbles
-        )
+        slot = self._count
+        self._pos[slot] = (x, y)
+        self._vel[slot] = (velocity_x, velocity_y)
+        self._radius[slot] = radius
+        self._hit_radius_sq[slot] = (radius * 1.1) ** 2  # 10% larger hitbox for better feel
+        self._color_idx[slot] = random.randrange(len(self.bubble_colors))
+        self._points[slot] = radius // 5  # More points for bigger bubbles
+        self._ids[slot] = self.next_bubble_id
+        self._count += 1
         
         self.next_bubble_id += 1
-        self.bubbles.append(bubble)
     
-    def check_collisions(self, pointer_x: float, pointer_y: float, is_shooting: bool) -> List[Bubble]:
+    def check_collisions(self, pointer_x: float, pointer_y: float, is_shooting: bool) -> np.ndarray:
         """
         Check for collisions between pointer and bubbles when shooting
         
@@ -149,44 +216,32 @@ class BubbleGame:
             is_shooting: True if hand is closed (shooting), False otherwise
             
         Returns:
-            List of bubbles that were hit
+            Array of ids of the bubbles that were hit
         """
-        hit_bubbles = []
-        
         if not is_shooting:
-            return hit_bubbles
+            return np.empty(0, dtype=np.int64)
         
         # Convert normalized coordinates to pixel coordinates
         pointer_pixel_x = pointer_x * self.screen_width
         pointer_pixel_y = pointer_y * self.screen_height
         
-        # Check collision with each bubble
-        for bubble in self.bubbles:
-            if bubble in hit_bubbles:
-                continue
-            
-            bubble_x = bubble.x * self.screen_width
-            bubble_y = bubble.y * self.screen_height
-            
-            # Calculate distance from pointer to bubble center
-            distance = np.sqrt((pointer_pixel_x - bubble_x)**2 + (pointer_pixel_y - bubble_y)**2)
-            
-            # Check if pointer is within bubble radius (with slight tolerance for better feel)
-            if distance <= bubble.radius * 1.1:  # 10% larger hitbox for better feel
-                hit_bubbles.append(bubble)
-                self.score += bubble.points
-                self.bubbles_popped += 1
-        
-        # Remove hit bubbles
-        for bubble in hit_bubbles:
-            if bubble in self.bubbles:
-                self.bubbles.remove(bubble)
-        
-        return hit_bubbles
+        # Bubble centers in pixels against squared hit radii
+        n = self._count
+        bubbles_xy = self._pos[:n] * self._scale
+        
+        hit_indices = collide(bubbles_xy, self._hit_radius_sq[:n], pointer_pixel_x, pointer_pixel_y)
+        hit_ids = self._ids[hit_indices]
+        
+        self.score += int(self._points[hit_indices].sum())
+        self.bubbles_popped += len(hit_indices)
+        
+        self._remove(hit_indices)
+        
+        return hit_ids
     
     def reset(self) -> None:
         """Reset game state"""
-        self.bubbles.clear()
+        self._count = 0
         self.score = 0
         self.bubbles_popped = 0
         self.last_spawn_time = time.time()
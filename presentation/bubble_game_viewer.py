@@ -4,11 +4,16 @@ Bubble game viewer with hand detection - Two separate windows
 import cv2
 import numpy as np
 import time
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from domain.interfaces import IHandDetector, ICamera
 from domain.models import DetectionResult, Hand, Point, HandLandmark
 from domain.gesture_detector import GestureDetector
+from domain._kernels import scale_landmarks
 from presentation.bubble_game import BubbleGame
+from presentation.detection_worker import DetectionWorker
+from presentation.drawing import (CONNECTION_CHAINS, LANDMARK_STYLES, blend_stamp, clip_rect,
+                                  render_text_stamp)
+from presentation.key_poller import KeyPoller
 
 
 class BubbleGameViewer:
@@ -26,10 +31,26 @@ class BubbleGameViewer:
         self.camera = camera
         self.window_name = "Bubble Game - Hand Detection"
         self.game: Optional[BubbleGame] = None
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter()
         self.gesture_detector = GestureDetector()
         self.player_name: Optional[str] = None
         self.camera_view_size = (200, 150)  # Width, Height for top right corner
+        self._game_buf: Optional[np.ndarray] = None  # Game screen reused every frame
+        self._cam_thumb: Optional[np.ndarray] = None  # Camera view thumbnail reused every frame
+        
+        # Pointer (color, glow color, size) keyed by is_shooting; the glow is
+        # the color lightened by 50 per channel
+        self._pointer_styles = {
+            False: ((0, 255, 255), (50, 255, 255), 25),  # Yellow when aiming
+            True: ((0, 0, 255), (50, 50, 255), 30),  # Red when shooting
+        }
+        
+        # Pre-rendered bubble sprites keyed by (color, radius); bounded by the
+        # color palette and the radius range
+        self._sprite_cache: Dict[Tuple[Tuple[int, int, int], int], Tuple[np.ndarray, np.ndarray]] = {}
+        
+        # Pre-rendered stamps for static text keyed by (text, scale, passes)
+        self._static_stamps: Dict[tuple, Tuple[np.ndarray, np.ndarray, Tuple[int, int]]] = {}
     
     def draw_hand_landmarks(self, image: np.ndarray, detection_result: DetectionResult) -> np.ndarray:
         """
@@ -40,122 +61,102 @@ class BubbleGameViewer:
             detection_result: Detection result
             
         Returns:
-            Image with hand landmarks drawn
+            The same image with hand landmarks drawn in place
         """
         if not detection_result or not detection_result.hands:
             return image
         
-        annotated_image = image.copy()
-        h, w, _ = annotated_image.shape
-        
-        # Hand connections (MediaPipe format)
-        connections = [
-            (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
-            (0, 5), (5, 6), (6, 7), (7, 8),  # Index finger
-            (0, 9), (9, 10), (10, 11), (11, 12),  # Middle finger
-            (0, 13), (13, 14), (14, 15), (15, 16),  # Ring finger
-            (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky
-            (5, 9), (9, 13), (13, 17)  # Palm connections
-        ]
+        h, w, _ = image.shape
+        font = cv2.FONT_HERSHEY_SIMPLEX
         
         for hand in detection_result.hands:
-            # Draw connections
-            for start_idx, end_idx in connections:
-                start_point = hand.landmarks[start_idx]
-                end_point = hand.landmarks[end_idx]
-                
-                start = (int(start_point.x * w), int(start_point.y * h))
-                end = (int(end_point.x * w), int(end_point.y * h))
-                
-                cv2.line(annotated_image, start, end, (0, 255, 0), 2)
+            # Scale all landmarks to pixel coordinates at once
+            pixels = scale_landmarks(hand.xy, w, h)
+            points = pixels.tolist()
+            
+            # Draw connections in one call
+            cv2.polylines(image, [pixels[chain] for chain in CONNECTION_CHAINS],
+                          False, (0, 255, 0), 2)
             
             # Draw landmarks
-            for idx, landmark in enumerate(hand.landmarks):
-                x = int(landmark.x * w)
-                y = int(landmark.y * h)
-                
-                # Different colors for different landmark types
-                if idx == 0:  # Wrist
-                    color = (255, 0, 255)  # Magenta
-                    radius = 5
-                elif idx in [4, 8, 12, 16, 20]:  # Fingertips
-                    color = (0, 0, 255)  # Red
-                    radius = 4
-                else:
-                    color = (0, 255, 0)  # Green
-                    radius = 3
-                
-                cv2.circle(annotated_image, (x, y), radius, color, -1)
+            for (x, y), (color, radius, line_type) in zip(points, LANDMARK_STYLES):
+                cv2.circle(image, (x, y), radius, color, -1, line_type)
             
             # Draw shooting status on camera
             is_closed = self.gesture_detector.is_hand_closed(hand)
             status_text = "CLOSED (SHOOTING)" if is_closed else "OPEN (AIMING)"
             status_color = (0, 0, 255) if is_closed else (0, 255, 0)
-            wrist = hand.landmarks[0]
-            label_x = int(wrist.x * w)
-            label_y = int(wrist.y * h) - 30
-            cv2.putText(annotated_image, status_text, (label_x, label_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, status_color, 2)
+            label_x = points[0][0]
+            label_y = points[0][1] - 30
+            cv2.putText(image, status_text, (label_x, label_y),
+                       font, 0.6, status_color, 2)
         
-        return annotated_image
+        return image
     
-    def draw_camera_view(self, main_image: np.ndarray, camera_frame: np.ndarray) -> np.ndarray:
+    def draw_camera_view(self, main_image: np.ndarray, camera_frame: np.ndarray,
+                         decorations: bool = True) -> np.ndarray:
         """
         Draw camera view in top right corner of main image
         
         Args:
             main_image: Main game image
             camera_frame: Camera frame with hand detection
+            decorations: Draw the border and label; pass False when main_image
+                already has them from the previous frame
             
         Returns:
-            Combined image
+            The main image with the camera view drawn in place
         """
-        combined_image = main_image.copy()
-        h, w = combined_image.shape[:2]
+        h, w = main_image.shape[:2]
         
         # Camera view size
         cam_w, cam_h = self.camera_view_size
         
-        # Resize camera frame to fit in corner
-        camera_resized = cv2.resize(camera_frame, (cam_w, cam_h))
+        # Resize camera frame to fit in corner, into the reusable thumbnail buffer
+        if self._cam_thumb is None or self._cam_thumb.shape[:2] != (cam_h, cam_w):
+            self._cam_thumb = np.empty((cam_h, cam_w, 3), dtype=np.uint8)
+        camera_resized = cv2.resize(camera_frame, (cam_w, cam_h), dst=self._cam_thumb,
+                                    interpolation=cv2.INTER_AREA)
         
         # Position in top right corner
         x_offset = w - cam_w - 10
         y_offset = 10
         
         # Draw border
-        cv2.rectangle(combined_image,
-                     (x_offset - 2, y_offset - 2),
-                     (x_offset + cam_w + 2, y_offset + cam_h + 2),
-                     (255, 255, 255), 2)
+        if decorations:
+            cv2.rectangle(main_image,
+                         (x_offset - 2, y_offset - 2),
+                         (x_offset + cam_w + 2, y_offset + cam_h + 2),
+                         (255, 255, 255), 2)
         
         # Overlay camera view
-        combined_image[y_offset:y_offset + cam_h, x_offset:x_offset + cam_w] = camera_resized
+        main_image[y_offset:y_offset + cam_h, x_offset:x_offset + cam_w] = camera_resized
         
-        # Draw label
-        label = "Camera"
-        cv2.putText(combined_image, label, (x_offset, y_offset - 5),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        # Draw label (anti-aliased, so it must not be drawn twice onto the same pixels)
+        if decorations:
+            label = "Camera"
+            cv2.putText(main_image, label, (x_offset, y_offset - 5),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
         
-        return combined_image
+        return main_image
     
     def create_game_screen(self, width: int, height: int) -> np.ndarray:
         """
-        Create game screen with bubbles and pointer
+        Get a cleared game screen, reusing the buffer from the previous frame
         
         Args:
             width: Screen width
             height: Screen height
-            pointer_x: Pointer x position (normalized)
-            pointer_y: Pointer y position (normalized)
-            is_shooting: True if shooting
             
         Returns:
-            Game screen image
+            Black game screen image (valid until the next call)
         """
-        # Create black background
-        game_screen = np.zeros((height, width, 3), dtype=np.uint8)
-        return game_screen
+        # Allocate only when the size changes; otherwise clear in place
+        if self._game_buf is None or self._game_buf.shape[:2] != (height, width):
+            self._game_buf = np.zeros((height, width, 3), dtype=np.uint8)
+        else:
+            self._game_buf.fill(0)
+        return self._game_buf
     
     def draw_bubbles(self, image: np.ndarray) -> np.ndarray:
         """
@@ -165,39 +166,124 @@ class BubbleGameViewer:
             image: Game screen image
             
         Returns:
-            Image with bubbles drawn
+            The same image with bubbles drawn in place
         """
         if not self.game:
             return image
         
-        annotated_image = image.copy()
-        h, w = annotated_image.shape[:2]
+        h, w = image.shape[:2]
+        
+        # Scale all centers at once and cull bubbles whose sprite (radius plus
+        # the 2px border) lies entirely off screen
+        centers = (self.game.positions * (w, h)).astype(np.int32)
+        radii = self.game.radii.astype(np.int32)
+        xs, ys = centers[:, 0], centers[:, 1]
+        extent = radii + 2
+        visible = np.flatnonzero((xs + extent >= 0) & (xs - extent < w) &
+                                 (ys + extent >= 0) & (ys - extent < h))
+        if len(visible) == 0:
+            return image
         
-        for bubble in self.game.bubbles:
-            x = int(bubble.x * w)
-            y = int(bubble.y * h)
-            
-            # Draw bubble with smooth edges
-            cv2.circle(annotated_image, (x, y), bubble.radius, bubble.color, -1)
-            
-            # Outer border
-            cv2.circle(annotated_image, (x, y), bubble.radius, (255, 255, 255), 2)
-            
-            # Inner border for depth
-            cv2.circle(annotated_image, (x, y), bubble.radius - 2, (200, 200, 200), 1)
+        palette = [tuple(color) for color in self.game.bubble_colors.tolist()]
+        for x, y, radius, color_idx in zip(xs[visible].tolist(), ys[visible].tolist(),
+                                           radii[visible].tolist(),
+                                           self.game.color_indices[visible].tolist()):
+            sprite, mask = self._bubble_sprite(palette[color_idx], radius)
+            half = sprite.shape[0] // 2
+            self._blit(image, sprite, mask, x - half, y - half)
+        
+        return image
+    
+    def _blit(self, image: np.ndarray, sprite: np.ndarray, mask: np.ndarray, x0: int, y0: int) -> None:
+        """
+        Copy the masked pixels of a sprite into an image, clipped to the image bounds
+        
+        Args:
+            image: Destination image (modified in place)
+            sprite: Sprite image
+            mask: (h, w) uint8 mask, nonzero for the sprite pixels to copy
+            x0: Destination x of the sprite's left edge
+            y0: Destination y of the sprite's top edge
+        """
+        rect = clip_rect(image, sprite, x0, y0)
+        if rect is not None:
+            dst, src = rect
+            cv2.copyTo(sprite[src], mask[src], image[dst])
+    
+    def _bubble_sprite(self, color: Tuple[int, int, int],
+                       radius: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the pre-rendered sprite for a bubble, rendering it on first use
+        
+        Args:
+            color: Bubble fill color (BGR)
+            radius: Bubble radius in pixels
             
-            # Draw highlight for 3D effect
-            highlight_x = x - bubble.radius // 3
-            highlight_y = y - bubble.radius // 3
-            highlight_radius = bubble.radius // 3
-            cv2.circle(annotated_image, (highlight_x, highlight_y), 
-                      highlight_radius, (255, 255, 255), -1)
+        Returns:
+            Tuple of (sprite image, uint8 mask of drawn pixels) centered on the bubble
+        """
+        key = (color, radius)
+        cached = self._sprite_cache.get(key)
+        if cached is None:
+            cached = self._make_bubble_sprite(color, radius)
+            self._sprite_cache[key] = cached
+        return cached
+    
+    @staticmethod
+    def _make_bubble_sprite(color: Tuple[int, int, int],
+                            radius: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Render a bubble onto a small transparent canvas
+        
+        Args:
+            color: Bubble fill color (BGR)
+            radius: Bubble radius in pixels
             
-            # Small inner highlight
-            cv2.circle(annotated_image, (highlight_x, highlight_y), 
-                      highlight_radius // 2, (255, 255, 255), -1)
+        Returns:
+            Tuple of (sprite image, (size, size) uint8 mask of drawn pixels)
+        """
+        # Leave room for the 2px outer border around the bubble
+        half = radius + 2
+        size = 2 * half + 1
+        sprite = np.zeros((size, size, 3), dtype=np.uint8)
+        alpha = np.zeros((size, size), dtype=np.uint8)
+        center = (half, half)
+        
+        highlight_center = (half - radius // 3, half - radius // 3)
+        highlight_radius = radius // 3
+        circles = [
+            (center, radius, color, -1),  # Bubble fill
+            (center, radius, (255, 255, 255), 2),  # Outer border
+            (center, radius - 2, (200, 200, 200), 1),  # Inner border for depth
+            (highlight_center, highlight_radius, (255, 255, 255), -1),  # Highlight for 3D effect
+            (highlight_center, highlight_radius // 2, (255, 255, 255), -1),  # Small inner highlight
+        ]
+        for circle_center, circle_radius, circle_color, thickness in circles:
+            cv2.circle(sprite, circle_center, circle_radius, circle_color, thickness)
+            cv2.circle(alpha, circle_center, circle_radius, 255, thickness)
+        
+        return sprite, alpha
+    
+    def _draw_static_text(self, image: np.ndarray, text: str, org: Tuple[int, int],
+                          scale: float, passes: Tuple[Tuple[Tuple[int, int, int], int], ...]) -> None:
+        """
+        Draw text that rarely changes by blitting a cached pre-rendered stamp
         
-        return annotated_image
+        Args:
+            image: Destination image (modified in place)
+            text: Text to draw
+            org: Bottom-left corner of the text, as for cv2.putText
+            scale: Font scale
+            passes: (color, thickness) of each cv2.putText pass, drawn in order
+        """
+        key = (text, scale, passes)
+        stamp = self._static_stamps.get(key)
+        if stamp is None:
+            stamp = render_text_stamp(text, scale, passes)
+            self._static_stamps[key] = stamp
+        
+        premultiplied, inverse_coverage, (origin_x, origin_y) = stamp
+        blend_stamp(image, premultiplied, inverse_coverage, org[0] - origin_x, org[1] - origin_y)
     
     def draw_pointer(self, image: np.ndarray, pointer_x: float, pointer_y: float, 
                      is_shooting: bool) -> np.ndarray:
@@ -211,53 +297,46 @@ class BubbleGameViewer:
             is_shooting: True if hand is closed (shooting)
             
         Returns:
-            Image with pointer drawn
+            The same image with pointer drawn in place
         """
-        annotated_image = image.copy()
-        h, w = annotated_image.shape[:2]
+        h, w = image.shape[:2]
         
         x = int(pointer_x * w)
         y = int(pointer_y * h)
         
-        # Color changes based on shooting state
-        if is_shooting:
-            color = (0, 0, 255)  # Red when shooting
-            size = 30
-        else:
-            color = (0, 255, 255)  # Yellow when aiming
-            size = 25
+        # Color and size change based on shooting state
+        color, glow_color, size = self._pointer_styles[is_shooting]
         
         # Draw crosshair with anti-aliasing effect
         line_length = size
         thickness = 3
         
         # Outer glow effect (lighter version)
-        glow_color = tuple(min(255, c + 50) for c in color)
-        cv2.line(annotated_image, 
+        cv2.line(image, 
                 (x - line_length - 2, y), 
                 (x + line_length + 2, y), 
                 glow_color, 1)
-        cv2.line(annotated_image, 
+        cv2.line(image, 
                 (x, y - line_length - 2), 
                 (x, y + line_length + 2), 
                 glow_color, 1)
         
         # Main crosshair lines
-        cv2.line(annotated_image, 
+        cv2.line(image, 
                 (x - line_length, y), 
                 (x + line_length, y), 
                 color, thickness)
-        cv2.line(annotated_image, 
+        cv2.line(image, 
                 (x, y - line_length), 
                 (x, y + line_length), 
                 color, thickness)
         
         # Center circle with glow
-        cv2.circle(annotated_image, (x, y), size // 2 + 1, glow_color, 1)
-        cv2.circle(annotated_image, (x, y), size // 2, color, 2)
-        cv2.circle(annotated_image, (x, y), 4, color, -1)
+        cv2.circle(image, (x, y), size // 2 + 1, glow_color, 1)
+        cv2.circle(image, (x, y), size // 2, color, 2)
+        cv2.circle(image, (x, y), 4, color, -1)
         
-        return annotated_image
+        return image
     
     def draw_game_info(self, image: np.ndarray, fps: float, is_shooting: bool) -> np.ndarray:
         """
@@ -269,71 +348,84 @@ class BubbleGameViewer:
             is_shooting: True if hand is closed (shooting)
             
         Returns:
-            Image with game info
+            The same image with game info drawn in place
         """
         if not self.game:
             return image
         
-        annotated_image = image.copy()
+        font = cv2.FONT_HERSHEY_SIMPLEX
         
         # Player name
         if self.player_name:
             name_text = f"Player: {self.player_name}"
-            cv2.putText(annotated_image, name_text, (10, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-            cv2.putText(annotated_image, name_text, (10, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 1)
+            self._draw_static_text(image, name_text, (10, 30), 0.7,
+                                   (((255, 255, 255), 2), ((0, 0, 0), 1)))
             y_offset = 60
         else:
             y_offset = 30
         
         # Score
         score_text = f"Score: {self.game.score}"
-        cv2.putText(annotated_image, score_text, (10, y_offset),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2)
-        cv2.putText(annotated_image, score_text, (10, y_offset),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 1)
+        cv2.putText(image, score_text, (10, y_offset),
+                   font, 0.8, (255, 255, 0), 2)
         
         # Bubbles popped
         popped_text = f"Popped: {self.game.bubbles_popped}"
-        cv2.putText(annotated_image, popped_text, (10, y_offset + 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-        cv2.putText(annotated_image, popped_text, (10, y_offset + 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 1)
+        cv2.putText(image, popped_text, (10, y_offset + 30),
+                   font, 0.7, (255, 255, 0), 2)
         
         # Active bubbles
-        bubbles_text = f"Bubbles: {len(self.game.bubbles)}"
-        cv2.putText(annotated_image, bubbles_text, (10, y_offset + 60),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-        cv2.putText(annotated_image, bubbles_text, (10, y_offset + 60),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 1)
+        bubbles_text = f"Bubbles: {self.game.bubble_count}"
+        cv2.putText(image, bubbles_text, (10, y_offset + 60),
+                   font, 0.7, (255, 255, 0), 2)
         
         # Shooting status
         shoot_status = "SHOOTING!" if is_shooting else "Aiming..."
         shoot_color = (0, 0, 255) if is_shooting else (0, 255, 255)
-        cv2.putText(annotated_image, shoot_status, (10, y_offset + 90),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, shoot_color, 2)
-        cv2.putText(annotated_image, shoot_status, (10, y_offset + 90),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 1)
+        cv2.putText(image, shoot_status, (10, y_offset + 90),
+                   font, 0.7, shoot_color, 2)
         
         # FPS
-        fps_text = f"FPS: {fps:.1f}"
-        cv2.putText(annotated_image, fps_text, (10, y_offset + 120),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        fps_text = f"FPS: {fps:.1f} (camera {self.camera.capture_fps:.1f})"
+        cv2.putText(image, fps_text, (10, y_offset + 120),
+                   font, 0.6, (0, 255, 0), 2)
         
         # Instructions
         instruction = "Press 'q' to quit, 'r' to reset"
-        cv2.putText(annotated_image, instruction, (10, annotated_image.shape[0] - 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
-        cv2.putText(annotated_image, instruction, (10, annotated_image.shape[0] - 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1)
+        self._draw_static_text(image, instruction, (10, image.shape[0] - 20), 0.5,
+                               (((255, 255, 255), 2), ((0, 0, 0), 1)))
+        
+        return image
+    
+    def _render_signature(self, width: int, height: int, pointer_x: float, pointer_y: float,
+                          is_shooting: bool, fps: float) -> tuple:
+        """
+        Summarize everything visible on the game layer at pixel resolution
         
-        return annotated_image
+        Args:
+            width: Screen width
+            height: Screen height
+            pointer_x: Pointer x position (normalized 0.0 to 1.0)
+            pointer_y: Pointer y position (normalized 0.0 to 1.0)
+            is_shooting: True if hand is closed (shooting)
+            fps: Frames per second shown in the HUD
+            
+        Returns:
+            Tuple that compares equal when the game layer would render identically
+        """
+        game = self.game
+        centers = (game.positions * (width, height)).astype(np.int32)
+        return (
+            centers.tobytes(), game.radii.tobytes(), game.color_indices.tobytes(),
+            int(pointer_x * width), int(pointer_y * height), is_shooting,
+            game.score, game.bubbles_popped, self.player_name,
+            f"{fps:.1f}", f"{self.camera.capture_fps:.1f}"
+        )
     
     def run(self) -> None:
         """Run the bubble game with combined view in single window"""
-        # Check if detector is already initialized
-        if not hasattr(self.detector, '_initialized') or not self.detector._initialized:
+        # Initialize detector unless the caller already did
+        if not self.detector.is_initialized:
             if not self.detector.initialize():
                 print("Failed to initialize hand detector")
                 return
@@ -374,10 +466,18 @@ class BubbleGameViewer:
         print("Press 'q' to quit, 'r' to reset score")
         print("=" * 60)
         
-        fps_start_time = time.time()
-        fps_frame_count = 0
         fps = 0.0
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter()
+        
+        # FPS shown in the HUD, refreshed on a fixed interval so the readout
+        # is legible and does not force a game layer redraw every frame
+        shown_fps = 0.0
+        shown_fps_time = self.last_update_time
+        fps_refresh_interval = 0.5
+        
+        # Capture and detection run on a worker thread; this thread renders
+        worker = DetectionWorker(self.detector, self.camera)
+        worker.start()
         
         # Track pointer position with smoothing
         pointer_x = 0.5
@@ -387,30 +487,31 @@ class BubbleGameViewer:
         smoothing_factor = 0.15  # Lower = smoother but slower response
         is_shooting = False
         
+        # Signature of what the last drawn game layer showed
+        last_signature = None
+        
+        # Poll keys without the 1 ms waitKey wait on every frame
+        key_poller = KeyPoller()
+        
         try:
             while True:
-                current_time = time.time()
+                current_time = time.perf_counter()
                 delta_time = current_time - self.last_update_time
                 self.last_update_time = current_time
                 
-                # Read frame
-                result = self.camera.read()
+                # Get newest frame and its detection result
+                result = worker.read()
                 if result is None:
                     break
                 
-                success, camera_frame = result
-                if not success:
-                    break
+                camera_frame, detection_result = result
                 
                 # Update game (clamp delta_time for stability)
                 if self.game:
-                    clamped_delta = min(delta_time, 0.1)  # Prevent large time jumps
+                    clamped_delta = 0.1 if delta_time > 0.1 else delta_time  # Prevent large time jumps
                     self.game.update(clamped_delta)
                 
-                # Detect hands
-                detection_result = self.detector.detect(camera_frame)
-                
-                # Update pointer and shooting state with smoothing
+                # Update pointer target and shooting state
                 if detection_result and detection_result.hands:
                     # Use first detected hand
                     hand = detection_result.hands[0]
@@ -421,56 +522,63 @@ class BubbleGameViewer:
                         # Update target position (flip X to match mirrored camera view)
                         target_pointer_x = 1.0 - finger_tip.x  # Mirror X coordinate
                         target_pointer_y = finger_tip.y
-                        
-                        # Smooth interpolation for pointer movement
-                        pointer_x += (target_pointer_x - pointer_x) * smoothing_factor
-                        pointer_y += (target_pointer_y - pointer_y) * smoothing_factor
                     
                     # Check if hand is closed (shooting)
                     is_shooting = self.gesture_detector.is_hand_closed(hand)
-                    
-                    # Check collisions when shooting (use smoothed position)
-                    if is_shooting and self.game:
-                        self.game.check_collisions(pointer_x, pointer_y, is_shooting)
                 else:
                     is_shooting = False
                     # Smoothly return to center when no hand detected
                     target_pointer_x = 0.5
                     target_pointer_y = 0.5
-                    pointer_x += (target_pointer_x - pointer_x) * smoothing_factor
-                    pointer_y += (target_pointer_y - pointer_y) * smoothing_factor
-                
-                # ===== CREATE COMBINED VIEW =====
-                # Create game screen
-                game_screen = self.create_game_screen(game_width, game_height)
                 
-                # Draw bubbles
-                game_screen = self.draw_bubbles(game_screen)
+                # Smooth interpolation for pointer movement
+                pointer_x += (target_pointer_x - pointer_x) * smoothing_factor
+                pointer_y += (target_pointer_y - pointer_y) * smoothing_factor
                 
-                # Draw pointer
-                game_screen = self.draw_pointer(game_screen, pointer_x, pointer_y, is_shooting)
+                # Check collisions when shooting (use smoothed position)
+                if is_shooting and self.game:
+                    self.game.check_collisions(pointer_x, pointer_y, is_shooting)
                 
-                # Draw game info
-                game_screen = self.draw_game_info(game_screen, fps, is_shooting)
+                # ===== CREATE COMBINED VIEW =====
+                # Redraw the game layer only when something on it changed; the
+                # camera view below fully covers its corner every frame
+                if current_time - shown_fps_time >= fps_refresh_interval:
+                    shown_fps = fps
+                    shown_fps_time = current_time
+                signature = self._render_signature(game_width, game_height,
+                                                   pointer_x, pointer_y, is_shooting, shown_fps)
+                redraw = signature != last_signature
+                if redraw:
+                    last_signature = signature
+                    
+                    # Create game screen
+                    game_screen = self.create_game_screen(game_width, game_height)
+                    
+                    # Draw bubbles
+                    game_screen = self.draw_bubbles(game_screen)
+                    
+                    # Draw pointer
+                    game_screen = self.draw_pointer(game_screen, pointer_x, pointer_y, is_shooting)
+                    
+                    # Draw game info
+                    game_screen = self.draw_game_info(game_screen, shown_fps, is_shooting)
                 
                 # Draw camera view with hand landmarks
-                camera_display = self.draw_hand_landmarks(camera_frame.copy(), detection_result)
+                # (the frame is not used after this, so draw on it directly)
+                camera_display = self.draw_hand_landmarks(camera_frame, detection_result)
                 
                 # Combine: camera in top right, game fills rest
-                combined_view = self.draw_camera_view(game_screen, camera_display)
+                combined_view = self.draw_camera_view(game_screen, camera_display, decorations=redraw)
                 
-                # Calculate FPS
-                fps_frame_count += 1
-                if fps_frame_count >= 30:
-                    fps = 30.0 / (time.time() - fps_start_time)
-                    fps_start_time = time.time()
-                    fps_frame_count = 0
+                # Calculate FPS (moving average, seeded with the first frame)
+                if delta_time > 0:
+                    fps = 1.0 / delta_time if fps == 0.0 else 0.9 * fps + 0.1 / delta_time
                 
                 # Display combined window
                 cv2.imshow(self.window_name, combined_view)
                 
                 # Handle keyboard input
-                key = cv2.waitKey(1) & 0xFF
+                key = key_poller.read()
                 if key == ord('q'):
                     break
                 elif key == ord('r') and self.game:
@@ -482,6 +590,7 @@ class BubbleGameViewer:
         
         finally:
             # Cleanup (don't release camera/detector here - app_flow handles it)
+            worker.stop()
             cv2.destroyAllWindows()
             if self.game:
                 print(f"\nFinal Score: {self.game.score}")
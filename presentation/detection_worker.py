@@ -0,0 +1,135 @@
+"""
+Background camera capture and hand detection pipeline
+"""
+import threading
+import numpy as np
+from typing import Optional, Tuple
+from domain.interfaces import IHandDetector, ICamera
+from domain.models import DetectionResult
+
+
+class DetectionWorker:
+    """Reads camera frames and runs hand detection on a background thread"""
+    
+    def __init__(self, detector: IHandDetector, camera: ICamera, read_timeout: Optional[float] = None,
+                 max_duplicate_reuse: int = 3):
+        """
+        Initialize detection worker
+        
+        Args:
+            detector: Initialized hand detector (used only by the worker thread while running)
+            camera: Opened camera
+            read_timeout: Seconds read() waits for a new result before failing;
+                None waits as long as the worker is running (the first
+                detection can take seconds while the model warms up)
+            max_duplicate_reuse: Consecutive frames that may reuse the previous
+                detection because they look identical to the last detected one
+                (0 disables the duplicate-frame check)
+        """
+        self.detector = detector
+        self.camera = camera
+        self.read_timeout = read_timeout
+        self.max_duplicate_reuse = max_duplicate_reuse
+        
+        # Single-slot latest result shared with the worker thread; results the
+        # consumer has not picked up are overwritten rather than queued, so
+        # detection of the next frame overlaps rendering of the current one
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._result_ready = threading.Condition()
+        self._latest: Optional[Tuple[np.ndarray, Optional[DetectionResult]]] = None
+        self._result_id = 0  # Increments for every processed frame
+        self._read_id = 0  # Result id last returned by read()
+        self._running = False
+    
+    def start(self) -> None:
+        """Start the background detection thread"""
+        if self._thread is not None:
+            return
+        
+        # A fresh stop event per thread, so a thread left stalled by stop()
+        # cannot be revived by a later start()
+        self._stop = threading.Event()
+        self._latest = None
+        self._result_id = 0
+        self._read_id = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._detect_loop, args=(self._stop,), daemon=True)
+        self._thread.start()
+    
+    def _detect_loop(self, stop: threading.Event) -> None:
+        """Read and detect continuously, keeping only the newest result, until stop is set"""
+        last_signature = None
+        detection_result = None
+        reused = 0
+        
+        try:
+            while not stop.is_set():
+                # The camera waits for frames itself and fails only once
+                # capture has ended
+                result = self.camera.read()
+                if result is None or not result[0]:
+                    print("Camera stopped delivering frames")
+                    break
+                
+                frame = result[1]
+                
+                # Cameras can deliver the same image twice; reuse the previous
+                # detection for those, but re-run it after a few frames so a
+                # sampling collision cannot hide real changes for long
+                signature = self._frame_signature(frame)
+                if signature == last_signature and reused < self.max_duplicate_reuse:
+                    reused += 1
+                else:
+                    detection_result = self.detector.detect(frame)
+                    last_signature = signature
+                    reused = 0
+                
+                # Camera frames are not reused after read(), so no copy is needed
+                with self._result_ready:
+                    if stop.is_set():
+                        break
+                    self._latest = (frame, detection_result)
+                    self._result_id += 1
+                    self._result_ready.notify_all()
+        finally:
+            with self._result_ready:
+                if not stop.is_set():
+                    self._running = False
+                    self._result_ready.notify_all()
+    
+    @staticmethod
+    def _frame_signature(frame: np.ndarray) -> int:
+        """Cheap identity check: hash of a sparse sample of the green channel"""
+        return hash(frame[::64, ::64, 1].tobytes())
+    
+    def read(self) -> Optional[Tuple[np.ndarray, Optional[DetectionResult]]]:
+        """
+        Get the newest (frame, detection) pair not yet returned, waiting for it if needed
+        
+        Returns:
+            Tuple of (BGR frame, DetectionResult or None), or None if the
+            worker stopped (or read_timeout elapsed)
+        """
+        with self._result_ready:
+            self._result_ready.wait_for(
+                lambda: self._result_id != self._read_id or not self._running,
+                timeout=self.read_timeout
+            )
+            if self._result_id == self._read_id:
+                return None
+            self._read_id = self._result_id
+            return self._latest
+    
+    def stop(self) -> None:
+        """Stop the detection thread (camera and detector stay open)"""
+        with self._result_ready:
+            self._stop.set()
+            self._running = False
+            self._result_ready.notify_all()
+        if self._thread is not None:
+            # A stalled device can block the thread in camera.read(); leave
+            # the daemon thread behind rather than hang the UI
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._latest = None
@@ -0,0 +1,161 @@
+"""
+Shared drawing helpers for the OpenCV views
+"""
+import cv2
+import numpy as np
+from typing import List, Optional, Tuple
+
+
+# Landmark kinds: 0 = wrist, 1 = fingertip, 2 = other joint
+_LANDMARK_KIND = np.full(21, 2, dtype=np.int8)
+_LANDMARK_KIND[0] = 0
+_LANDMARK_KIND[[4, 8, 12, 16, 20]] = 1
+
+# (color, radius, line type) per kind, and looked up per landmark index;
+# the small dots use cheaper 4-connected edges, indistinguishable at that size
+_KIND_STYLES = (
+    ((255, 0, 255), 5, cv2.LINE_8),  # Wrist: magenta
+    ((0, 0, 255), 4, cv2.LINE_4),  # Fingertips: red
+    ((0, 255, 0), 3, cv2.LINE_4),  # Other joints: green
+)
+LANDMARK_STYLES = [_KIND_STYLES[kind] for kind in _LANDMARK_KIND]
+
+# Hand connections (MediaPipe format) as connected chains for cv2.polylines
+CONNECTION_CHAINS = [
+    np.array(chain, dtype=np.intp) for chain in (
+        (0, 1, 2, 3, 4),  # Thumb
+        (0, 5, 6, 7, 8),  # Index finger
+        (0, 9, 10, 11, 12),  # Middle finger
+        (0, 13, 14, 15, 16),  # Ring finger
+        (0, 17, 18, 19, 20),  # Pinky
+        (5, 9, 13, 17),  # Palm connections
+    )
+]
+
+
+def clip_rect(image: np.ndarray, patch: np.ndarray, x0: int, y0: int) -> Optional[tuple]:
+    """
+    Clip a patch placed at (x0, y0) against the image bounds
+    
+    Args:
+        image: Destination image
+        patch: Patch image
+        x0: Destination x of the patch's left edge
+        y0: Destination y of the patch's top edge
+    
+    Returns:
+        Tuple of (destination slices, patch slices), or None if nothing is visible
+    """
+    h, w = image.shape[:2]
+    x1, y1 = x0 + patch.shape[1], y0 + patch.shape[0]
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x1, w), min(y1, h)
+    if cx0 >= cx1 or cy0 >= cy1:
+        return None
+    
+    return ((slice(cy0, cy1), slice(cx0, cx1)),
+            (slice(cy0 - y0, cy1 - y0), slice(cx0 - x0, cx1 - x0)))
+
+
+def blend_stamp(image: np.ndarray, premultiplied: np.ndarray, inverse_coverage: np.ndarray,
+                x0: int, y0: int) -> None:
+    """
+    Blend a pre-rendered stamp over an image in place, clipped to the image bounds
+    
+    Args:
+        image: Destination image (modified in place)
+        premultiplied: Stamp color premultiplied by coverage (uint8)
+        inverse_coverage: 3-channel uint8 of 255 minus coverage
+        x0: Destination x of the stamp's left edge
+        y0: Destination y of the stamp's top edge
+    """
+    rect = clip_rect(image, premultiplied, x0, y0)
+    if rect is None:
+        return
+    
+    # Saturating 8-bit arithmetic in OpenCV: roi * (1 - alpha) + premultiplied
+    dst, src = rect
+    roi = image[dst]
+    cv2.add(cv2.multiply(roi, inverse_coverage[src], scale=1 / 255.0), premultiplied[src], dst=roi)
+
+
+def _draw_op(canvas: np.ndarray, coverage: np.ndarray, op: tuple) -> None:
+    """Draw one ('rect', ...) or ('text', ...) operation onto a canvas and its coverage"""
+    if op[0] == 'rect':
+        _, top_left, bottom_right, color, thickness = op
+        cv2.rectangle(canvas, top_left, bottom_right, color, thickness)
+        cv2.rectangle(coverage, top_left, bottom_right, 255, thickness)
+    else:
+        _, text, origin, scale, color, thickness = op
+        cv2.putText(canvas, text, origin, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+        cv2.putText(coverage, text, origin, cv2.FONT_HERSHEY_SIMPLEX, scale, 255, thickness)
+
+
+def render_patches(ops: list, h: int, w: int) -> List[Tuple[int, int, np.ndarray, np.ndarray]]:
+    """
+    Render drawing operations into stamps for blend_stamp
+    
+    Drawing onto black yields the color premultiplied by coverage, and
+    drawing white onto black yields the coverage itself, so text keeps its
+    anti-aliased edges when blended over a different background.
+    
+    Args:
+        ops: ('rect', top_left, bottom_right, color, thickness) and
+            ('text', text, origin, scale, color, thickness) tuples, drawn in order
+        h: Frame height
+        w: Frame width
+    
+    Returns:
+        List of (y, x, premultiplied color, inverse coverage) patches, one
+        per horizontal band of drawn rows
+    """
+    canvas = np.zeros((h, w, 3), dtype=np.uint8)
+    coverage = np.zeros((h, w), dtype=np.uint8)
+    for op in ops:
+        _draw_op(canvas, coverage, op)
+    
+    # Split into bands of consecutive drawn rows, cropped to their columns
+    patches = []
+    rows = np.flatnonzero(coverage.any(axis=1))
+    if len(rows) == 0:
+        return patches
+    breaks = np.flatnonzero(np.diff(rows) > 1)
+    for band in np.split(rows, breaks + 1):
+        y0, y1 = int(band[0]), int(band[-1]) + 1
+        cols = np.flatnonzero(coverage[y0:y1].any(axis=0))
+        x0, x1 = int(cols[0]), int(cols[-1]) + 1
+        patches.append((
+            y0, x0,
+            canvas[y0:y1, x0:x1].copy(),
+            cv2.cvtColor(255 - coverage[y0:y1, x0:x1], cv2.COLOR_GRAY2BGR)
+        ))
+    return patches
+
+
+def render_text_stamp(text: str, scale: float,
+                      passes: Tuple[Tuple[Tuple[int, int, int], int], ...]
+                      ) -> Tuple[np.ndarray, np.ndarray, Tuple[int, int]]:
+    """
+    Render text onto a tight stamp for blend_stamp
+    
+    Args:
+        text: Text to render
+        scale: Font scale
+        passes: (color, thickness) of each cv2.putText pass, drawn in order
+    
+    Returns:
+        Tuple of (premultiplied color, inverse coverage, text origin within the stamp)
+    """
+    thickness = max(pass_thickness for _, pass_thickness in passes)
+    (text_w, text_h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+    
+    # Pad by the stroke width so thick strokes are not clipped
+    pad = thickness + 1
+    origin = (pad, text_h + pad)
+    
+    canvas = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad, 3), dtype=np.uint8)
+    coverage = np.zeros(canvas.shape[:2], dtype=np.uint8)
+    for color, pass_thickness in passes:
+        _draw_op(canvas, coverage, ('text', text, origin, scale, color, pass_thickness))
+    
+    return canvas, cv2.cvtColor(255 - coverage, cv2.COLOR_GRAY2BGR), origin
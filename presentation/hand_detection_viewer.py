@@ -1,11 +1,15 @@
 """
 Hand detection viewer using OpenCV
 """
+import time
 import cv2
 import numpy as np
 from typing import Optional
 from domain.interfaces import IHandDetector, ICamera
 from domain.models import DetectionResult, Hand, Point
+from domain._kernels import scale_landmarks
+from presentation.drawing import CONNECTION_CHAINS, LANDMARK_STYLES
+from presentation.key_poller import KeyPoller
 
 
 class HandDetectionViewer:
@@ -32,65 +36,38 @@ class HandDetectionViewer:
             detection_result: Detection result
             
         Returns:
-            Image with landmarks drawn
+            The same image with landmarks drawn in place
         """
         if not detection_result or not detection_result.hands:
             return image
         
-        annotated_image = image.copy()
-        h, w, _ = annotated_image.shape
-        
-        # Hand connections (MediaPipe format)
-        connections = [
-            (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
-            (0, 5), (5, 6), (6, 7), (7, 8),  # Index finger
-            (0, 9), (9, 10), (10, 11), (11, 12),  # Middle finger
-            (0, 13), (13, 14), (14, 15), (15, 16),  # Ring finger
-            (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky
-            (5, 9), (9, 13), (13, 17)  # Palm connections
-        ]
+        h, w, _ = image.shape
+        font = cv2.FONT_HERSHEY_SIMPLEX
         
         for hand in detection_result.hands:
-            # Draw connections
-            for start_idx, end_idx in connections:
-                start_point = hand.landmarks[start_idx]
-                end_point = hand.landmarks[end_idx]
-                
-                start = (int(start_point.x * w), int(start_point.y * h))
-                end = (int(end_point.x * w), int(end_point.y * h))
-                
-                cv2.line(annotated_image, start, end, (0, 255, 0), 2)
+            # Scale all landmarks to pixel coordinates at once
+            pixels = scale_landmarks(hand.xy, w, h)
+            points = pixels.tolist()
+            
+            # Draw connections in one call
+            cv2.polylines(image, [pixels[chain] for chain in CONNECTION_CHAINS],
+                          False, (0, 255, 0), 2)
             
             # Draw landmarks
-            for idx, landmark in enumerate(hand.landmarks):
-                x = int(landmark.x * w)
-                y = int(landmark.y * h)
-                
-                # Different colors for different landmark types
-                if idx == 0:  # Wrist
-                    color = (255, 0, 255)  # Magenta
-                    radius = 5
-                elif idx in [4, 8, 12, 16, 20]:  # Fingertips
-                    color = (0, 0, 255)  # Red
-                    radius = 4
-                else:
-                    color = (0, 255, 0)  # Green
-                    radius = 3
-                
-                cv2.circle(annotated_image, (x, y), radius, color, -1)
+            for (x, y), (color, radius, line_type) in zip(points, LANDMARK_STYLES):
+                cv2.circle(image, (x, y), radius, color, -1, line_type)
             
             # Draw handedness label
-            wrist = hand.landmarks[0]
-            label_x = int(wrist.x * w)
-            label_y = int(wrist.y * h) - 20
+            label_x = points[0][0]
+            label_y = points[0][1] - 20
             label = f"{hand.handedness} ({hand.confidence:.2f})"
             
-            cv2.putText(annotated_image, label, (label_x, label_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
-            cv2.putText(annotated_image, label, (label_x, label_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1)
+            cv2.putText(image, label, (label_x, label_y),
+                       font, 0.5, (255, 255, 255), 2)
+            cv2.putText(image, label, (label_x, label_y),
+                       font, 0.5, (0, 0, 0), 1, cv2.LINE_4)
         
-        return annotated_image
+        return image
     
     def draw_info(self, image: np.ndarray, fps: float, num_hands: int) -> np.ndarray:
         """
@@ -102,26 +79,26 @@ class HandDetectionViewer:
             num_hands: Number of detected hands
             
         Returns:
-            Image with info overlay
+            The same image with info overlay drawn in place
         """
-        annotated_image = image.copy()
+        font = cv2.FONT_HERSHEY_SIMPLEX
         
         # FPS
-        fps_text = f"FPS: {fps:.1f}"
-        cv2.putText(annotated_image, fps_text, (10, 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        fps_text = f"FPS: {fps:.1f} (camera {self.camera.capture_fps:.1f})"
+        cv2.putText(image, fps_text, (10, 30),
+                   font, 0.7, (0, 255, 0), 2)
         
         # Hand count
         hands_text = f"Hands: {num_hands}"
-        cv2.putText(annotated_image, hands_text, (10, 60),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        cv2.putText(image, hands_text, (10, 60),
+                   font, 0.7, (0, 255, 0), 2)
         
         # Instructions
         instruction = "Press 'q' to quit"
-        cv2.putText(annotated_image, instruction, (10, annotated_image.shape[0] - 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        cv2.putText(image, instruction, (10, image.shape[0] - 20),
+                   font, 0.5, (255, 255, 255), 1)
         
-        return annotated_image
+        return image
     
     def run(self) -> None:
         """Run the hand detection viewer"""
@@ -138,10 +115,11 @@ class HandDetectionViewer:
         
         print("Hand Detection started. Press 'q' to quit.")
         
-        import time
-        fps_start_time = time.time()
-        fps_frame_count = 0
         fps = 0.0
+        last_frame_time = time.perf_counter()
+        
+        # Poll keys without the 1 ms waitKey wait on every frame
+        key_poller = KeyPoller()
         
         try:
             while True:
@@ -164,12 +142,12 @@ class HandDetectionViewer:
                 else:
                     num_hands = 0
                 
-                # Calculate FPS
-                fps_frame_count += 1
-                if fps_frame_count >= 30:
-                    fps = 30.0 / (time.time() - fps_start_time)
-                    fps_start_time = time.time()
-                    fps_frame_count = 0
+                # Calculate FPS (moving average, seeded with the first frame)
+                current_time = time.perf_counter()
+                frame_time = current_time - last_frame_time
+                last_frame_time = current_time
+                if frame_time > 0:
+                    fps = 1.0 / frame_time if fps == 0.0 else 0.9 * fps + 0.1 / frame_time
                 
                 # Draw info
                 frame = self.draw_info(frame, fps, num_hands)
@@ -178,7 +156,8 @@ class HandDetectionViewer:
                 cv2.imshow(self.window_name, frame)
                 
                 # Check for quit
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+                key = key_poller.read()
+                if key == ord('q'):
                     break
         
         except KeyboardInterrupt:
@@ -0,0 +1,27 @@
+"""
+Per-frame keyboard polling for OpenCV windows
+"""
+import cv2
+
+
+class KeyPoller:
+    """Reads key presses once per frame without always paying waitKey's 1 ms wait"""
+    
+    def __init__(self):
+        """Initialize key poller"""
+        # pollKey (OpenCV >= 4.5) returns immediately; waitKey still runs on
+        # every other frame to pump window events
+        self._poll_key = getattr(cv2, 'pollKey', None)
+        self._frame_index = 0
+    
+    def read(self) -> int:
+        """
+        Get the key pressed since the previous frame; call once per frame
+        
+        Returns:
+            Key code masked to 8 bits (0xFF if no key was pressed)
+        """
+        self._frame_index += 1
+        if self._poll_key is not None and self._frame_index & 1:
+            return self._poll_key() & 0xFF
+        return cv2.waitKey(1) & 0xFF
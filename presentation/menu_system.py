@@ -8,10 +8,21 @@ from typing import Optional, List, Tuple, Callable
 from domain.interfaces import IHandDetector, ICamera
 from domain.models import DetectionResult, Hand, Point
 from domain.gesture_detector import GestureDetector
+from domain._kernels import scale_landmarks
+from presentation.detection_worker import DetectionWorker
+from presentation.drawing import CONNECTION_CHAINS, blend_stamp, render_patches
+from presentation.key_poller import KeyPoller
+
+
+# Wider camera frames are downscaled once before the menu is drawn and shown
+MAX_DISPLAY_WIDTH = 1280
 
 
 class MenuItem:
     """Represents a menu item"""
+    __slots__ = ('text', 'action', 'position', 'width', 'height', 'is_hovered',
+                 'text_size', 'top_left', 'bottom_right', 'text_origin')
+    
     def __init__(self, text: str, action: Callable, position: Tuple[int, int]):
         self.text = text
         self.action = action
@@ -19,6 +30,13 @@ class MenuItem:
         self.width = 200
         self.height = 50
         self.is_hovered = False
+        
+        # Geometry is fixed once created, so lay it out once
+        x, y = position
+        self.text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
+        self.top_left = (x - self.width // 2, y - self.height // 2)
+        self.bottom_right = (x + self.width // 2, y + self.height // 2)
+        self.text_origin = (x - self.text_size[0] // 2, y + self.text_size[1] // 2)
 
 
 class MenuSystem:
@@ -38,13 +56,46 @@ class MenuSystem:
         self.gesture_detector = GestureDetector()
         self.menu_items: List[MenuItem] = []
         self.selected_index = 0
-        self.last_selection_time = 0
-        self.selection_cooldown = 1.0  # Seconds between selections
+        self.last_selection_ns = 0
+        self.selection_cooldown_ns = 1_000_000_000  # Nanoseconds between selections
+        
+        # Static text sizes (only their centering depends on the frame size)
+        self._title_size = cv2.getTextSize("Bubble Game", cv2.FONT_HERSHEY_SIMPLEX, 1.5, 3)[0]
+        self._subtitle_size = cv2.getTextSize("Use your finger to navigate", cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+        
+        # Pre-rendered menu: ((h, w), static patches, selected-state patches per item)
+        self._menu_cache: Optional[tuple] = None
+        
+        # Item bounding boxes as an (N, 4) array of left, right, top, bottom
+        self._bbox_arr: Optional[np.ndarray] = None
+        
+        # Reused destination for downscaling wide camera frames for display
+        self._display_buf: Optional[np.ndarray] = None
         
     def add_menu_item(self, text: str, action: Callable, position: Tuple[int, int]):
         """Add a menu item"""
         item = MenuItem(text, action, position)
         self.menu_items.append(item)
+        self._menu_cache = None
+        self._bbox_arr = None
+    
+    @staticmethod
+    def display_size(w: int, h: int) -> Tuple[int, int]:
+        """
+        Size at which a camera frame is drawn and shown
+        
+        Menu item positions are in this coordinate space.
+        
+        Args:
+            w: Camera frame width
+            h: Camera frame height
+            
+        Returns:
+            Tuple of (width, height), keeping the aspect ratio
+        """
+        if w <= MAX_DISPLAY_WIDTH:
+            return w, h
+        return MAX_DISPLAY_WIDTH, h * MAX_DISPLAY_WIDTH // w
     
     def draw_menu(self, image: np.ndarray) -> np.ndarray:
         """
@@ -54,191 +105,159 @@ class MenuSystem:
             image: Input image
             
         Returns:
-            Image with menu drawn
+            The same image with the menu drawn in place
         """
-        annotated_image = image.copy()
-        h, w = annotated_image.shape[:2]
+        h, w = image.shape[:2]
         
+        # Static menu content is pre-rendered once per frame size; each frame
+        # only composites it and the selected item's highlight
+        if self._menu_cache is None or self._menu_cache[0] != (h, w):
+            self._menu_cache = self._build_menu_cache(h, w)
+        
+        _, static_patches, selected_patches = self._menu_cache
+        for y0, x0, premultiplied, inverse_coverage in static_patches:
+            blend_stamp(image, premultiplied, inverse_coverage, x0, y0)
+        if 0 <= self.selected_index < len(selected_patches):
+            for y0, x0, premultiplied, inverse_coverage in selected_patches[self.selected_index]:
+                blend_stamp(image, premultiplied, inverse_coverage, x0, y0)
+        
+        return image
+    
+    def _build_menu_cache(self, h: int, w: int) -> tuple:
+        """
+        Pre-render the menu for a frame size
+        
+        Args:
+            h: Frame height
+            w: Frame width
+            
+        Returns:
+            Tuple of ((h, w), static patches, selected-state patches per item)
+        """
         # Draw title
         title = "Bubble Game"
-        title_size = cv2.getTextSize(title, cv2.FONT_HERSHEY_SIMPLEX, 1.5, 3)[0]
-        title_x = (w - title_size[0]) // 2
+        title_x = (w - self._title_size[0]) // 2
         title_y = 80
         
-        cv2.putText(annotated_image, title, (title_x, title_y),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255, 255, 255), 3)
-        cv2.putText(annotated_image, title, (title_x, title_y),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 0), 1)
+        ops = [
+            ('text', title, (title_x, title_y), 1.5, (255, 255, 255), 3),
+            ('text', title, (title_x, title_y), 1.5, (0, 0, 0), 1),
+        ]
         
         # Draw subtitle
         subtitle = "Use your finger to navigate"
-        subtitle_size = cv2.getTextSize(subtitle, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-        subtitle_x = (w - subtitle_size[0]) // 2
+        subtitle_x = (w - self._subtitle_size[0]) // 2
         subtitle_y = title_y + 40
         
-        cv2.putText(annotated_image, subtitle, (subtitle_x, subtitle_y),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 2)
+        ops.append(('text', subtitle, (subtitle_x, subtitle_y), 0.6, (200, 200, 200), 2))
         
-        # Draw menu items
-        for idx, item in enumerate(self.menu_items):
-            x, y = item.position
-            is_selected = (idx == self.selected_index)
-            
-            # Background rectangle
-            if is_selected:
-                color = (100, 200, 255)  # Light blue when selected
-                border_color = (255, 255, 0)  # Yellow border
-                border_thickness = 3
-            else:
-                color = (50, 50, 50)  # Dark gray
-                border_color = (150, 150, 150)  # Light gray border
-                border_thickness = 2
-            
-            # Draw background
-            top_left = (x - item.width // 2, y - item.height // 2)
-            bottom_right = (x + item.width // 2, y + item.height // 2)
-            cv2.rectangle(annotated_image, top_left, bottom_right, color, -1)
-            cv2.rectangle(annotated_image, top_left, bottom_right, border_color, border_thickness)
-            
-            # Draw text
-            text_size = cv2.getTextSize(item.text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
-            text_x = x - text_size[0] // 2
-            text_y = y + text_size[1] // 2
-            
-            text_color = (255, 255, 255) if is_selected else (200, 200, 200)
-            cv2.putText(annotated_image, item.text, (text_x, text_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, text_color, 2)
+        # Draw menu items (unselected; the selected one is drawn over it)
+        for item in self.menu_items:
+            ops.extend(self._item_ops(item, is_selected=False))
         
         # Draw instructions
         instruction = "Point at menu item and close hand to select"
-        cv2.putText(annotated_image, instruction, (10, h - 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        ops.append(('text', instruction, (10, h - 20), 0.5, (255, 255, 255), 1))
         
-        return annotated_image
+        static_patches = render_patches(ops, h, w)
+        selected_patches = [render_patches(self._item_ops(item, is_selected=True), h, w)
+                            for item in self.menu_items]
+        return (h, w), static_patches, selected_patches
+    
+    @staticmethod
+    def _item_ops(item: MenuItem, is_selected: bool) -> list:
+        """Drawing operations for one menu item"""
+        # Background rectangle
+        if is_selected:
+            color = (100, 200, 255)  # Light blue when selected
+            border_color = (255, 255, 0)  # Yellow border
+            border_thickness = 3
+        else:
+            color = (50, 50, 50)  # Dark gray
+            border_color = (150, 150, 150)  # Light gray border
+            border_thickness = 2
+        
+        text_color = (255, 255, 255) if is_selected else (200, 200, 200)
+        
+        return [
+            ('rect', item.top_left, item.bottom_right, color, -1),
+            ('rect', item.top_left, item.bottom_right, border_color, border_thickness),
+            ('text', item.text, item.text_origin, 0.7, text_color, 2),
+        ]
     
     def draw_hand_landmarks(self, image: np.ndarray, detection_result: DetectionResult) -> np.ndarray:
-        """Draw hand landmarks"""
+        """Draw hand landmarks in place"""
         if not detection_result or not detection_result.hands:
             return image
         
-        annotated_image = image.copy()
-        h, w, _ = annotated_image.shape
-        
-        connections = [
-            (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
-            (0, 5), (5, 6), (6, 7), (7, 8),  # Index finger
-            (0, 9), (9, 10), (10, 11), (11, 12),  # Middle finger
-            (0, 13), (13, 14), (14, 15), (15, 16),  # Ring finger
-            (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky
-            (5, 9), (9, 13), (13, 17)  # Palm connections
-        ]
+        h, w, _ = image.shape
         
         for hand in detection_result.hands:
-            # Draw connections
-            for start_idx, end_idx in connections:
-                if start_idx < len(hand.landmarks) and end_idx < len(hand.landmarks):
-                    start_point = hand.landmarks[start_idx]
-                    end_point = hand.landmarks[end_idx]
-                    
-                    start = (int(start_point.x * w), int(start_point.y * h))
-                    end = (int(end_point.x * w), int(end_point.y * h))
-                    
-                    cv2.line(annotated_image, start, end, (0, 255, 0), 2)
+            # Scale all landmarks to pixel coordinates at once
+            pixels = scale_landmarks(hand.xy, w, h)
+            
+            # Draw connections in one call
+            cv2.polylines(image, [pixels[chain] for chain in CONNECTION_CHAINS],
+                          False, (0, 255, 0), 2)
             
             # Draw index finger tip prominently
-            if len(hand.landmarks) > 8:
-                finger_tip = hand.landmarks[8]
-                tip_x = int(finger_tip.x * w)
-                tip_y = int(finger_tip.y * h)
-                cv2.circle(annotated_image, (tip_x, tip_y), 10, (0, 255, 255), -1)
-                cv2.circle(annotated_image, (tip_x, tip_y), 10, (0, 0, 255), 2)
-        
-        return annotated_image
+            tip = pixels[8].tolist()
+            cv2.circle(image, tip, 10, (0, 255, 255), -1)
+            cv2.circle(image, tip, 10, (0, 0, 255), 2)
+        
+        return image
     
-    def check_menu_selection(self, detection_result: DetectionResult) -> Optional[int]:
+    def _process_hand(self, detection_result: DetectionResult,
+                      h: int, w: int) -> Tuple[Optional[int], Optional[int]]:
         """
-        Check if user selected a menu item
+        Hit-test the index finger tip against the menu items
         
+        Args:
+            detection_result: Detection result for the current frame
+            h: Frame height
+            w: Frame width
+            
         Returns:
-            Index of selected item or None
+            Tuple of (index of the hovered item, index of the item selected
+            by closing the hand), each None if there is none
         """
         if not detection_result or not detection_result.hands:
-            return None
-        
-        current_time = time.time()
-        if current_time - self.last_selection_time < self.selection_cooldown:
-            return None
+            return None, None
         
         hand = detection_result.hands[0]
         
-        # Check if hand is closed (selection gesture)
-        is_closed = self.gesture_detector.is_hand_closed(hand)
-        if not is_closed:
-            return None
-        
         # Get index finger tip position
         finger_tip = self.gesture_detector.get_index_finger_tip(hand)
         if not finger_tip:
-            return None
-        
-        # Get frame dimensions
-        result = self.camera.read()
-        if result is None:
-            return None
-        
-        _, frame = result
-        h, w = frame.shape[:2]
-        
-        finger_x = int(finger_tip.x * w)
-        finger_y = int(finger_tip.y * h)
-        
-        # Check which menu item is being pointed at
-        for idx, item in enumerate(self.menu_items):
-            x, y = item.position
-            item_left = x - item.width // 2
-            item_right = x + item.width // 2
-            item_top = y - item.height // 2
-            item_bottom = y + item.height // 2
-            
-            if (item_left <= finger_x <= item_right and 
-                item_top <= finger_y <= item_bottom):
-                self.last_selection_time = current_time
-                return idx
-        
-        return None
-    
-    def update_selection(self, detection_result: DetectionResult):
-        """Update which menu item is being hovered"""
-        if not detection_result or not detection_result.hands:
-            return
-        
-        hand = detection_result.hands[0]
-        finger_tip = self.gesture_detector.get_index_finger_tip(hand)
-        if not finger_tip:
-            return
-        
-        result = self.camera.read()
-        if result is None:
-            return
-        
-        _, frame = result
-        h, w = frame.shape[:2]
+            return None, None
         
         finger_x = int(finger_tip.x * w)
         finger_y = int(finger_tip.y * h)
         
-        # Find which menu item is being pointed at
-        for idx, item in enumerate(self.menu_items):
-            x, y = item.position
-            item_left = x - item.width // 2
-            item_right = x + item.width // 2
-            item_top = y - item.height // 2
-            item_bottom = y + item.height // 2
-            
-            if (item_left <= finger_x <= item_right and 
-                item_top <= finger_y <= item_bottom):
-                self.selected_index = idx
-                break
+        # Find which menu item is being pointed at (the first one on overlap)
+        if self._bbox_arr is None:
+            self._bbox_arr = np.array([
+                (item.top_left[0], item.bottom_right[0], item.top_left[1], item.bottom_right[1])
+                for item in self.menu_items
+            ], dtype=np.int32).reshape(-1, 4)
+        
+        bbox = self._bbox_arr
+        hits = ((bbox[:, 0] <= finger_x) & (finger_x <= bbox[:, 1]) &
+                (bbox[:, 2] <= finger_y) & (finger_y <= bbox[:, 3]))
+        if not hits.any():
+            return None, None
+        
+        idx = int(np.argmax(hits))
+        current_ns = time.monotonic_ns()
+        if current_ns - self.last_selection_ns < self.selection_cooldown_ns:
+            return idx, None
+        
+        # Check if hand is closed (selection gesture), only once it could select
+        if not self.gesture_detector.is_hand_closed(hand):
+            return idx, None
+        
+        self.last_selection_ns = current_ns
+        return idx, idx
     
     def run(self) -> Optional[str]:
         """
@@ -247,8 +266,8 @@ class MenuSystem:
         Returns:
             Selected action result (e.g., "start_game") or None
         """
-        # Check if detector is already initialized
-        if not hasattr(self.detector, '_initialized') or not self.detector._initialized:
+        # Initialize detector unless the caller already did
+        if not self.detector.is_initialized:
             if not self.detector.initialize():
                 print("Failed to initialize hand detector")
                 return None
@@ -261,46 +280,63 @@ class MenuSystem:
         
         print("Menu system started. Point at menu items and close hand to select.")
         
+        # Capture and detection run on a worker thread; this thread renders
+        worker = DetectionWorker(self.detector, self.camera)
+        worker.start()
+        
+        # Poll keys without the 1 ms waitKey wait on every frame
+        key_poller = KeyPoller()
+        
         try:
             while True:
-                result = self.camera.read()
+                # Get newest frame and its detection result
+                result = worker.read()
                 if result is None:
                     break
                 
-                success, frame = result
-                if not success:
-                    break
+                frame, detection_result = result
                 
-                # Detect hands
-                detection_result = self.detector.detect(frame)
+                # Draw at display size; landmarks are normalized, so the
+                # detection result applies unchanged
+                h, w = frame.shape[:2]
+                display_w, display_h = self.display_size(w, h)
+                if display_w != w:
+                    if self._display_buf is None or self._display_buf.shape[:2] != (display_h, display_w):
+                        self._display_buf = np.empty((display_h, display_w, 3), dtype=np.uint8)
+                    frame = cv2.resize(frame, (display_w, display_h), dst=self._display_buf,
+                                       interpolation=cv2.INTER_LINEAR)
+                    h, w = display_h, display_w
                 
-                # Update selection
-                if detection_result:
-                    self.update_selection(detection_result)
+                # Update hover and check for selection
+                hovered_idx, selected_idx = self._process_hand(detection_result, h, w)
+                if hovered_idx is not None:
+                    self.selected_index = hovered_idx
                 
-                # Check for selection
-                selected_idx = self.check_menu_selection(detection_result)
                 if selected_idx is not None:
                     item = self.menu_items[selected_idx]
                     print(f"Selected: {item.text}")
+                    # Hand camera and detector back before the action runs
+                    worker.stop()
                     # Close menu window smoothly
                     cv2.destroyWindow(self.window_name)
                     # Small delay for smooth transition
-                    import time
                     time.sleep(0.05)
                     result = item.action()
                     if result:
                         return result
+                    worker.start()
                 
                 # Draw menu
                 frame = self.draw_menu(frame)
-                frame = self.draw_hand_landmarks(frame, detection_result)
+                if detection_result and detection_result.hands:
+                    frame = self.draw_hand_landmarks(frame, detection_result)
                 
                 # Display
                 cv2.imshow(self.window_name, frame)
                 
                 # Check for quit
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+                key = key_poller.read()
+                if key == ord('q'):
                     return None
         
         except KeyboardInterrupt:
@@ -308,7 +344,7 @@ class MenuSystem:
         
         finally:
             # Don't destroy window or release camera - smooth transition
-            pass
+            worker.stop()
         
         return None
 